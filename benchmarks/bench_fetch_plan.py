@@ -0,0 +1,165 @@
+# benchmarks/bench_fetch_plan.py
+"""Сравнение объема трафика и времени разбора JSON: прежний запрос
+forecast.json (days=2, alerts=yes) на каждый экран против планировщика
+запросов с кэшем.
+
+Запуск: python benchmarks/bench_fetch_plan.py
+
+Ответы WeatherAPI генерируются локально по структуре реального API,
+сеть не используется.
+"""
+import asyncio
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bot.config import ALL_LOCATIONS  # noqa: E402
+from bot.handlers import WEATHER_SCREEN_NEEDS  # noqa: E402
+from bot.services import WeatherService, DataNeed, FetchPlan, ALL_NEEDS  # noqa: E402
+
+# Сценарий пользователя: точка -> завтра -> назад -> опасные явления -> назад
+SCENARIO = [
+    WEATHER_SCREEN_NEEDS,
+    (DataNeed.TOMORROW,),
+    WEATHER_SCREEN_NEEDS,
+    (DataNeed.HOURLY, DataNeed.ALERTS),
+    WEATHER_SCREEN_NEEDS,
+]
+DECODE_REPEATS = 20
+
+CONDITION = {"text": "Переменная облачность", "icon": "//cdn.weatherapi.com/weather/64x64/day/116.png", "code": 1003}
+
+
+def _current(now: datetime) -> dict:
+    return {
+        "last_updated_epoch": int(now.timestamp()), "last_updated": now.strftime("%Y-%m-%d %H:%M"),
+        "temp_c": 12.3, "temp_f": 54.1, "is_day": 1, "condition": CONDITION,
+        "wind_mph": 6.9, "wind_kph": 11.2, "wind_degree": 230, "wind_dir": "SW",
+        "pressure_mb": 1015.0, "pressure_in": 29.97, "precip_mm": 0.1, "precip_in": 0.0,
+        "humidity": 71, "cloud": 50, "feelslike_c": 11.0, "feelslike_f": 51.8,
+        "windchill_c": 10.9, "windchill_f": 51.6, "heatindex_c": 12.3, "heatindex_f": 54.1,
+        "dewpoint_c": 7.1, "dewpoint_f": 44.8, "vis_km": 10.0, "vis_miles": 6.0,
+        "uv": 3.0, "gust_mph": 9.8, "gust_kph": 15.8,
+    }
+
+
+def _hour(moment: datetime) -> dict:
+    return {
+        "time_epoch": int(moment.timestamp()), "time": moment.strftime("%Y-%m-%d %H:%M"),
+        "temp_c": 10.0 + moment.hour / 3, "temp_f": 50.0 + moment.hour / 2, "is_day": int(6 <= moment.hour < 20),
+        "condition": CONDITION, "wind_mph": 7.4, "wind_kph": 11.9, "wind_degree": 220, "wind_dir": "SW",
+        "pressure_mb": 1014.0, "pressure_in": 29.95, "precip_mm": 0.2, "precip_in": 0.01,
+        "snow_cm": 0.0, "humidity": 70 + moment.hour % 7, "cloud": 40 + moment.hour, "feelslike_c": 9.5,
+        "feelslike_f": 49.1, "windchill_c": 9.5, "windchill_f": 49.1, "heatindex_c": 10.8,
+        "heatindex_f": 51.4, "dewpoint_c": 6.2, "dewpoint_f": 43.2, "will_it_rain": 0,
+        "chance_of_rain": moment.hour * 3 % 100, "will_it_snow": 0, "chance_of_snow": 0,
+        "chance_of_thunder": moment.hour * 2 % 100, "vis_km": 10.0, "vis_miles": 6.0,
+        "gust_mph": 11.2, "gust_kph": 18.0, "uv": 2.0,
+    }
+
+
+def _forecast_day(date: datetime) -> dict:
+    return {
+        "date": date.strftime("%Y-%m-%d"), "date_epoch": int(date.timestamp()),
+        "day": {
+            "maxtemp_c": 17.1, "maxtemp_f": 62.8, "mintemp_c": 7.4, "mintemp_f": 45.3,
+            "avgtemp_c": 11.9, "avgtemp_f": 53.4, "maxwind_mph": 10.3, "maxwind_kph": 16.6,
+            "totalprecip_mm": 1.4, "totalprecip_in": 0.06, "totalsnow_cm": 0.0,
+            "avgvis_km": 9.8, "avgvis_miles": 6.0, "avghumidity": 74, "daily_will_it_rain": 1,
+            "daily_chance_of_rain": 80, "daily_will_it_snow": 0, "daily_chance_of_snow": 0,
+            "condition": CONDITION, "uv": 4.0,
+        },
+        "astro": {
+            "sunrise": "06:12 AM", "sunset": "07:45 PM", "moonrise": "10:01 PM",
+            "moonset": "09:30 AM", "moon_phase": "Waning Gibbous", "moon_illumination": 81,
+        },
+        "hour": [_hour(date + timedelta(hours=h)) for h in range(24)],
+    }
+
+
+def make_response(plan: FetchPlan, location: str, now: datetime) -> dict:
+    """Ответ WeatherAPI той же структуры, что и у реального эндпоинта"""
+    lat, lon = location.split(",")
+    data = {
+        "location": {
+            "name": "Krasnaya Polyana", "region": "Krasnodarskiy Kray", "country": "Russia",
+            "lat": float(lat), "lon": float(lon), "tz_id": "Europe/Moscow",
+            "localtime_epoch": int(now.timestamp()), "localtime": now.strftime("%Y-%m-%d %H:%M"),
+        },
+        "current": _current(now),
+    }
+    if plan.endpoint == "forecast.json":
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        data["forecast"] = {
+            "forecastday": [_forecast_day(midnight + timedelta(days=d)) for d in range(plan.days)]
+        }
+        if plan.alerts:
+            data["alerts"] = {"alert": []}
+    return data
+
+
+class BenchWeatherService(WeatherService):
+    """WeatherService, отдающий сгенерированные ответы и считающий трафик"""
+
+    def __init__(self, full_fetch: bool = False):
+        super().__init__(api_key="bench")
+        self.full_fetch = full_fetch
+        self.calls = 0
+        self.raw_bytes = 0
+        self.gzip_bytes = 0
+        self.decode_seconds = 0.0
+
+    async def get_weather_data(self, location, *needs):
+        if self.full_fetch:
+            # Прежнее поведение: полный запрос на каждый экран без кэша
+            self._cache.clear()
+            needs = ALL_NEEDS
+        return await super().get_weather_data(location, *needs)
+
+    async def _request(self, plan, location):
+        body = json.dumps(make_response(plan, location, datetime(2024, 7, 1, 14, 0))).encode()
+        self.calls += 1
+        self.raw_bytes += len(body)
+        self.gzip_bytes += len(gzip.compress(body))
+
+        start = time.perf_counter()
+        for _ in range(DECODE_REPEATS):
+            data = json.loads(body)
+        self.decode_seconds += (time.perf_counter() - start) / DECODE_REPEATS
+        return data
+
+
+async def run(service: BenchWeatherService) -> BenchWeatherService:
+    for location in ALL_LOCATIONS.values():
+        for needs in SCENARIO:
+            await service.get_weather_data(location, *needs)
+    return service
+
+
+def main():
+    interactions = len(ALL_LOCATIONS) * len(SCENARIO)
+    results = [
+        ("forecast.json days=2 alerts=yes", asyncio.run(run(BenchWeatherService(full_fetch=True)))),
+        ("планировщик + кэш", asyncio.run(run(BenchWeatherService()))),
+    ]
+
+    print(f"Взаимодействий: {interactions}")
+    print(f"{'Стратегия':<34}{'запросов':>10}{'JSON, Б/вз.':>14}{'gzip, Б/вз.':>14}{'разбор, мкс/вз.':>18}")
+    for name, s in results:
+        print(
+            f"{name:<34}{s.calls:>10}{s.raw_bytes / interactions:>14.0f}"
+            f"{s.gzip_bytes / interactions:>14.0f}{s.decode_seconds / interactions * 1e6:>18.1f}"
+        )
+
+    base, planned = results[0][1], results[1][1]
+    print(f"Экономия gzip-трафика: {1 - planned.gzip_bytes / base.gzip_bytes:.0%}, "
+          f"времени разбора: {1 - planned.decode_seconds / base.decode_seconds:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,4 +24,7 @@ ALERT_WINDOW: int = 2  # Часов для предупреждения о гр
 CHECK_INTERVAL: int = 1800  # 30 минут между проверками
 
 # Коды погоды для грозы
-THUNDERSTORM_CODES: list = [1087, 1273, 1276, 1279, 1282]
\ No newline at end of file
+THUNDERSTORM_CODES: list = [1087, 1273, 1276, 1279, 1282]
+
+# Время жизни кэша ответов WeatherAPI (секунды)
+WEATHER_CACHE_TTL: int = 600
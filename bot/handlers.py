@@ -11,7 +11,7 @@ from bot.keyboards import (
     get_back_to_weather_keyboard,
     get_thunder_check_keyboard
 )
-from bot.services import WeatherService
+from bot.services import WeatherService, DataNeed
 from bot.config import LOCATIONS_C_SECTOR, LOCATION_EAST_SECTOR, ALL_LOCATIONS
 from bot.utils import format_weather_data
 
@@ -20,6 +20,9 @@ logger = logging.getLogger(__name__)
 # Состояния для ConversationHandler
 SELECTING_SECTOR, SELECTING_POINT, SHOWING_WEATHER = range(3)
 
+# Данные для экрана текущей погоды (format_weather_data показывает и ближайшие грозы)
+WEATHER_SCREEN_NEEDS = (DataNeed.CURRENT, DataNeed.TODAY, DataNeed.HOURLY)
+
 
 class BotHandlers:
     def __init__(self, weather_service: WeatherService):
@@ -80,7 +83,7 @@ class BotHandlers:
             return SELECTING_SECTOR
 
         # Получаем данные о погоде
-        data = await self.weather_service.get_weather_data(location)
+        data = await self.weather_service.get_weather_data(location, *WEATHER_SCREEN_NEEDS)
         if not data:
             await query.edit_message_text(text="Не удалось получить данные о погоде")
             return SELECTING_SECTOR
@@ -108,7 +111,7 @@ class BotHandlers:
             await query.edit_message_text(text="Ошибка: точка не найдена")
             return SHOWING_WEATHER
 
-        data = await self.weather_service.get_weather_data(location)
+        data = await self.weather_service.get_weather_data(location, DataNeed.TOMORROW)
         if not data or 'forecast' not in data:
             await query.edit_message_text(text="Не удалось получить прогноз")
             return SHOWING_WEATHER
@@ -149,9 +152,9 @@ class BotHandlers:
             await query.edit_message_text(text="Ошибка: точка не найдена")
             return SHOWING_WEATHER
 
-        # Проверяем грозу для конкретной точки
+        # Почасовой прогноз с предупреждениями; проверка грозы берет его из кэша
+        data = await self.weather_service.get_weather_data(location, DataNeed.HOURLY, DataNeed.ALERTS)
         has_thunder = await self.weather_service.check_thunder_for_point(location)
-        data = await self.weather_service.get_weather_data(location)
         alerts = self.weather_service.check_thunderstorm(data) if data else []
 
         message = f"⚠️ **Опасные явления для {point_name}**\n"
@@ -190,7 +193,7 @@ class BotHandlers:
         if not location:
             return await self.start(update, context)
 
-        data = await self.weather_service.get_weather_data(location)
+        data = await self.weather_service.get_weather_data(location, *WEATHER_SCREEN_NEEDS)
         if not data:
             return await self.start(update, context)
 
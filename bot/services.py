@@ -1,45 +1,134 @@
 import aiohttp
 import logging
-from typing import Dict, Optional
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from bot.config import THUNDERSTORM_CODES, ALERT_WINDOW
+from bot.config import THUNDERSTORM_CODES, ALERT_WINDOW, WEATHER_CACHE_TTL
 
 logger = logging.getLogger(__name__)
 
 
+class DataNeed(str, Enum):
+    """Данные, которые нужны экрану бота"""
+    CURRENT = "current"    # текущие условия
+    TODAY = "today"        # сводка на сегодня
+    TOMORROW = "tomorrow"  # сводка на завтра
+    HOURLY = "hourly"      # почасовой прогноз на ALERT_WINDOW часов
+    ALERTS = "alerts"      # официальные предупреждения
+
+
+# Набор данных по умолчанию (соответствует прежнему запросу days=2, alerts=yes)
+ALL_NEEDS: Tuple[DataNeed, ...] = tuple(DataNeed)
+
+
+@dataclass(frozen=True)
+class FetchPlan:
+    """Минимальный запрос к WeatherAPI для набора данных"""
+    endpoint: str
+    days: int = 0
+    alerts: bool = False
+
+    def covers(self, other: "FetchPlan") -> bool:
+        """Содержит ли ответ по этому плану все данные плана other"""
+        if other.endpoint == "current.json":
+            return True
+        return (
+            self.endpoint == "forecast.json"
+            and self.days >= other.days
+            and (self.alerts or not other.alerts)
+        )
+
+    def params(self) -> Dict[str, str]:
+        params = {"aqi": "no"}
+        if self.endpoint == "forecast.json":
+            params["days"] = str(self.days)
+            params["alerts"] = "yes" if self.alerts else "no"
+        return params
+
+
+def plan_fetch(needs, now: Optional[datetime] = None) -> FetchPlan:
+    """Выбирает самый дешевый эндпоинт и параметры для набора данных"""
+    needs = set(needs) or {DataNeed.CURRENT}
+    if needs == {DataNeed.CURRENT}:
+        return FetchPlan("current.json")
+
+    days = 1
+    if DataNeed.TOMORROW in needs:
+        days = 2
+    elif DataNeed.HOURLY in needs:
+        now = now or datetime.now()
+        if (now + timedelta(hours=ALERT_WINDOW)).date() != now.date():
+            days = 2
+
+    return FetchPlan("forecast.json", days=days, alerts=DataNeed.ALERTS in needs)
+
 
 class WeatherService:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api.weatherapi.com/v1"
         self.session = None
+        self._cache: Dict[str, List[Tuple[FetchPlan, datetime, Dict]]] = {}
 
     async def _ensure_session(self):
         if self.session is None or self.session.closed:
             self.session = aiohttp.ClientSession()
 
-    async def get_weather_data(self, location: str) -> Optional[Dict]:
-        """Получает данные о погоде для указанной локации"""
+    def _get_cached(self, location: str, plan: FetchPlan) -> Optional[Dict]:
+        now = datetime.now()
+        entries = [e for e in self._cache.get(location, []) if e[1] > now]
+        self._cache[location] = entries
+        for cached_plan, _, data in entries:
+            if cached_plan.covers(plan):
+                return data
+        return None
+
+    def _store(self, location: str, plan: FetchPlan, data: Dict):
+        entries = [e for e in self._cache.get(location, []) if not plan.covers(e[0])]
+        entries.append((plan, datetime.now() + timedelta(seconds=WEATHER_CACHE_TTL), data))
+        self._cache[location] = entries
+
+    async def _request(self, plan: FetchPlan, location: str) -> Optional[Dict]:
+        await self._ensure_session()
+        params = {"key": self.api_key, "q": location, **plan.params()}
+        async with self.session.get(
+            f"{self.base_url}/{plan.endpoint}",
+            params=params,
+            headers={"Accept-Encoding": "gzip"}
+        ) as resp:
+            if resp.status == 200:
+                return await resp.json()
+            return None
+
+    async def get_weather_data(self, location: str, *needs: DataNeed) -> Optional[Dict]:
+        """Получает данные о погоде для указанной локации.
+
+        needs -- какие данные нужны экрану; без них запрашивается полный набор.
+        Ответ берется из кэша, если там уже есть запрос с большим набором данных.
+        """
         try:
-            await self._ensure_session()
-            params = {
-                "key": self.api_key,
-                "q": location,
-                "days": 2,
-                "alerts": "yes"
-            }
-            async with self.session.get(f"{self.base_url}/forecast.json", params=params) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                return None
+            plan = plan_fetch(needs or ALL_NEEDS)
+            data = self._get_cached(location, plan)
+            if data is not None:
+                return data
+
+            data = await self._request(plan, location)
+            if data is not None:
+                self._store(location, plan, data)
+            return data
         except Exception as e:
             logger.error(f"API error: {e}")
             return None
 
     async def check_thunder(self) -> bool:
         """Проверяет наличие грозы через API"""
+        return await self.check_thunder_for_point("Minsk")
+
+    async def check_thunder_for_point(self, location: str) -> bool:
+        """Проверяет наличие грозы для конкретной точки"""
         try:
-            data = await self.get_weather_data("Minsk")
+            data = await self.get_weather_data(location, DataNeed.ALERTS)
             if not data:
                 return False
 
@@ -76,18 +165,3 @@ class WeatherService:
             logger.error(f"Ошибка при обработке данных: {str(e)}")
 
         return alerts
-
-
-# services.py (добавить в класс WeatherService)
-async def check_thunder_for_point(self, location: str) -> bool:
-    """Проверяет наличие грозы для конкретной точки"""
-    try:
-        data = await self.get_weather_data(location)
-        if not data:
-            return False
-
-        alerts = data.get("alerts", {}).get("alert", [])
-        return any("гроза" in alert.get("event", "").lower() for alert in alerts)
-    except Exception as e:
-        logger.error(f"Ошибка при проверке грозы: {e}")
-        return False
\ No newline at end of file
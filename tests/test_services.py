@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 from datetime import datetime
-from bot.services import WeatherService
+from bot.services import WeatherService, DataNeed, FetchPlan, plan_fetch
 from bot.config import THUNDERSTORM_CODES
 from bot.config import THUNDERSTORM_CODES, ALERT_WINDOW
 
@@ -71,3 +71,35 @@ def test_check_thunderstorm(weather_service):
         assert len(alerts) == 1
         assert alerts[0]["time"] == "12:00 01.01"
 
+
+def test_plan_fetch_current_only():
+    plan = plan_fetch([DataNeed.CURRENT])
+    assert plan == FetchPlan("current.json")
+    assert plan.params() == {"aqi": "no"}
+
+
+def test_plan_fetch_forecast_params():
+    morning = datetime(2023, 1, 1, 9, 0)
+    assert plan_fetch([DataNeed.CURRENT, DataNeed.TODAY], now=morning) == FetchPlan("forecast.json", days=1)
+    assert plan_fetch([DataNeed.TOMORROW], now=morning).days == 2
+    assert plan_fetch([DataNeed.HOURLY, DataNeed.ALERTS], now=morning).params() == {
+        "aqi": "no", "days": "1", "alerts": "yes"
+    }
+    # Почасовое окно переходит через полночь
+    late = datetime(2023, 1, 1, 23, 0)
+    assert plan_fetch([DataNeed.HOURLY], now=late).days == 2
+
+
+@pytest.mark.asyncio
+async def test_get_weather_data_reuses_cached_superset(weather_service):
+    mock_request = AsyncMock(return_value={"forecast": {"forecastday": [{}, {}]}})
+    with patch.object(WeatherService, "_request", mock_request):
+        await weather_service.get_weather_data("loc", DataNeed.TOMORROW)
+        await weather_service.get_weather_data("loc", DataNeed.CURRENT, DataNeed.TODAY)
+        await weather_service.get_weather_data("loc", DataNeed.CURRENT)
+        assert mock_request.await_count == 1
+
+        # Предупреждений в кэше нет -- нужен новый запрос
+        await weather_service.get_weather_data("loc", DataNeed.ALERTS)
+        assert mock_request.await_count == 2
+        assert mock_request.await_args.args[0] == FetchPlan("forecast.json", days=1, alerts=True)